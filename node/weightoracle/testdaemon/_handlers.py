@@ -0,0 +1,149 @@
+# Copyright (C) 2019-2026 Algorand, Inc.
+# This file is part of go-algorand
+#
+# go-algorand is free software: you can redistribute it and/or modify
+# it under the terms of the GNU Affero General Public License as
+# published by the Free Software Foundation, either version 3 of the
+# License, or (at your option) any later version.
+#
+# go-algorand is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+# GNU Affero General Public License for more details.
+#
+# You should have received a copy of the GNU Affero General Public License
+# along with go-algorand.  If not, see <https://www.gnu.org/licenses/>.
+
+"""
+Per-request helpers for the mock weight oracle daemon.
+
+These are the stateless pieces of request handling (HTTP framing, response
+building and weight lookup). They live in their own fully typed module so they
+can optionally be compiled with mypyc; see README.md. daemon.py imports the
+compiled extension when one has been built and this source file otherwise.
+"""
+
+import functools
+from http import HTTPStatus
+
+# Requests are tiny; anything larger is a broken or hostile client.
+MAX_HEAD_SIZE = 8 * 1024
+MAX_BODY_SIZE = 64 * 1024
+
+
+def status_for_code(code: str) -> int:
+    """Map an error code to its HTTP status."""
+    if code == "bad_request":
+        return 400
+    if code == "not_found":
+        return 404
+    return 500
+
+
+def parse_request_head(head: bytes) -> tuple[str, str, bool, dict[str, str]] | None:
+    """
+    Parse an HTTP request line and headers.
+
+    Returns (method, path, keep_alive, headers) with lower-cased header names,
+    or None if the request line is malformed.
+    """
+    lines = head.decode("latin-1").split("\r\n")
+    request_line = lines[0].split()
+    if len(request_line) != 3:
+        return None
+    method, path, version = request_line
+    headers: dict[str, str] = {}
+    for line in lines[1:]:
+        name, sep, value = line.partition(":")
+        if sep:
+            headers[name.strip().lower()] = value.strip()
+
+    connection = headers.get("connection", "").lower()
+    if version == "HTTP/1.1":
+        keep_alive = connection != "close"
+    else:
+        keep_alive = connection == "keep-alive"
+    return method, path, keep_alive, headers
+
+
+def content_length(headers: dict[str, str]) -> int:
+    """Return the request body length, or raise ValueError if the body cannot be framed."""
+    # Bodies are framed by Content-Length only. Anything else would desynchronize
+    # a keep-alive connection, so it is rejected rather than guessed at.
+    if "transfer-encoding" in headers:
+        raise ValueError("Transfer-Encoding is not supported; send Content-Length")
+    value = headers.get("content-length", "0")
+    if not value.isdigit():
+        raise ValueError(f"Invalid Content-Length: {value!r}")
+    length = int(value)
+    if length > MAX_BODY_SIZE:
+        raise ValueError(f"Request body too large: {length} bytes (max {MAX_BODY_SIZE})")
+    return length
+
+
+def _response_head(status: int, keep_alive: bool) -> bytes:
+    """Build the status line and fixed headers of a response, up to the Content-Length value."""
+    return (
+        f"HTTP/1.1 {status} {HTTPStatus(status).phrase}\r\n"
+        "Content-Type: application/json\r\n"
+        f"Connection: {'keep-alive' if keep_alive else 'close'}\r\n"
+        "Content-Length: "
+    ).encode("latin-1")
+
+
+# Response heads for every status the daemon sends, built once.
+_RESPONSE_HEADS: dict[tuple[int, bool], bytes] = {
+    (status, keep_alive): _response_head(status, keep_alive)
+    for status in (200, 400, 404, 500)
+    for keep_alive in (True, False)
+}
+
+
+def http_response(status: int, payload: bytes, keep_alive: bool) -> bytes:
+    """
+    Build a complete HTTP/1.1 response carrying a JSON payload.
+
+    Head and body go out as one buffer so each response is a single send.
+    """
+    head = _RESPONSE_HEADS.get((status, keep_alive))
+    if head is None:
+        head = _response_head(status, keep_alive)
+    return b"%s%d\r\n\r\n%s" % (head, len(payload), payload)
+
+
+def weight_payload(weight: int) -> bytes:
+    """Encode a /weight success body without building and serializing a dict."""
+    return b'{"weight":"%d"}' % weight
+
+
+def total_weight_payload(total_weight: int) -> bytes:
+    """Encode a /total_weight success body without building and serializing a dict."""
+    return b'{"total_weight":"%d"}' % total_weight
+
+
+@functools.lru_cache(maxsize=4096)
+def fallback_weight(address: str) -> int:
+    """Deterministic weight for an address missing from every table (sum of its code points)."""
+    if address.isascii():
+        return sum(address.encode("ascii")) % 1000000
+    return sum(map(ord, address)) % 1000000
+
+
+def lookup_weight(
+    weight_table: dict[tuple[str, str, str], int],
+    address: str,
+    selection_id: str,
+    balance_round: str,
+) -> int:
+    """
+    Resolve an account weight from the full weight table, or the fallback.
+
+    Addresses in address_weights never get here: WeightDaemon answers them from
+    its cached payloads first.
+    """
+    weight = weight_table.get((address, selection_id, balance_round))
+    if weight is None:
+        # Default behavior: return a weight based on address hash for consistency
+        # This allows testing without a full weight table
+        weight = fallback_weight(address)
+    return weight
@@ -18,13 +18,15 @@
 """
 Mock Weight Oracle Daemon for Testing (HTTP REST version)
 
-A minimal HTTP server that simulates the weight oracle daemon for integration testing.
-Supports configurable responses for weight, total_weight, ping, and identity queries.
+A minimal asyncio-based HTTP server that simulates the weight oracle daemon for
+integration testing. Supports configurable responses for weight, total_weight,
+ping, and identity queries.
 
 HTTP REST Protocol:
 - All requests are HTTP POST with JSON body
 - The endpoint path determines the request type
 - Responses are always JSON
+- HTTP/1.1 persistent connections are supported (the Go client pools them)
 
 Endpoints:
     POST /ping         - Health check
@@ -51,80 +53,107 @@ Error response (any endpoint):
 """
 
 import argparse
+import asyncio
 import base64
 import json
+import os
 import sys
 import threading
-import time
-from http.server import HTTPServer, BaseHTTPRequestHandler
-from typing import Any
-
-
-class WeightDaemonHandler(BaseHTTPRequestHandler):
-    """HTTP request handler for the weight daemon."""
-
-    def log_message(self, format: str, *args: Any) -> None:
-        """Suppress default HTTP logging to stderr."""
-        pass
-
-    def _send_json_response(self, status_code: int, response: dict[str, Any]) -> None:
-        """Send a JSON response with the given status code."""
-        self.send_response(status_code)
-        self.send_header("Content-Type", "application/json")
-        self.end_headers()
-        self.wfile.write(json.dumps(response).encode("utf-8"))
-
-    def _send_json_error(self, status_code: int, message: str, code: str) -> None:
-        """Send a JSON error response (always JSON, not HTML)."""
-        self._send_json_response(status_code, {"error": message, "code": code})
-
-    def do_POST(self) -> None:
-        """Handle POST requests by routing to the appropriate handler."""
-        # Apply latency if configured
-        daemon = self.server.daemon  # type: ignore[attr-defined]
-        if daemon.latency > 0:
-            time.sleep(daemon.latency)
-
-        # Read request body
-        content_length = int(self.headers.get("Content-Length", 0))
-        body = self.rfile.read(content_length)
-
-        try:
-            request = json.loads(body) if body else {}
-        except json.JSONDecodeError as e:
-            self._send_json_error(400, f"Invalid JSON: {e}", "bad_request")
-            return
-
-        # Route to handler based on path
-        if self.path == "/ping":
-            response = daemon._handle_ping()
-        elif self.path == "/identity":
-            response = daemon._handle_identity()
-        elif self.path == "/weight":
-            response = daemon._handle_weight(request)
-        elif self.path == "/total_weight":
-            response = daemon._handle_total_weight(request)
-        else:
-            self._send_json_error(404, f"Unknown endpoint: {self.path}", "not_found")
-            return
-
-        # Check if handler returned an error response
-        if "error" in response:
-            code = response.get("code", "internal")
-            if code == "bad_request":
-                status = 400
-            elif code == "not_found":
-                status = 404
-            else:
-                status = 500
-            self._send_json_response(status, response)
-        else:
-            self._send_json_response(200, response)
+import types
+from typing import Any, Callable, cast
+
+from _handlers import (
+    MAX_HEAD_SIZE,
+    content_length,
+    http_response,
+    lookup_weight,
+    parse_request_head,
+    status_for_code,
+    total_weight_payload,
+    weight_payload,
+)
+
+try:
+    # Optional: uvloop's libuv-based loop has cheaper accept/recv/send paths than
+    # the stdlib selector loop. The daemon falls back to plain asyncio without it.
+    import uvloop
+except ImportError:
+    uvloop = None
+
+try:
+    # Optional: orjson parses and serializes in C (and returns bytes directly),
+    # which keeps JSON work on the event loop short.
+    import orjson
+except ImportError:
+    orjson = None
+
+if orjson is not None:
+    _json_loads = orjson.loads
+    _json_dumps = orjson.dumps
+else:
+
+    def _json_loads(data: bytes | memoryview) -> Any:
+        """Parse a JSON request body (json.loads does not accept memoryviews)."""
+        return json.loads(bytes(data))
+
+    def _json_dumps(obj: Any) -> bytes:
+        """Serialize obj as compact UTF-8 JSON, matching orjson's output."""
+        return json.dumps(obj, separators=(",", ":")).encode("utf-8")
+
+
+def _error_response(message: str, code: str) -> tuple[int, bytes]:
+    """Build the (status, JSON payload) pair for an error response."""
+    return status_for_code(code), _json_dumps({"error": message, "code": code})
+
+
+# Fixed error responses, built once. Malformed requests are the cheapest thing
+# for a misbehaving client to send, so answering them must not cost formatting.
+_INVALID_JSON_RESPONSE = _error_response("Invalid JSON", "bad_request")
+_NOT_AN_OBJECT_RESPONSE = _error_response("Invalid JSON: expected an object", "bad_request")
+_HEAD_TOO_LARGE_RESPONSE = _error_response(f"Request head too large (max {MAX_HEAD_SIZE} bytes)", "bad_request")
+_MALFORMED_REQUEST_LINE_RESPONSE = _error_response("Malformed request line", "bad_request")
+_MISSING_FIELD_RESPONSES = {
+    field: _error_response(f"Missing {field} field", "bad_request")
+    for field in ("address", "selection_id", "balance_round", "vote_round")
+}
+# Request fields are JSON strings. Other types are rejected up front so that
+# the typed helpers in _handlers behave the same compiled or not.
+_NON_STRING_FIELD_RESPONSES = {
+    field: _error_response(f"Invalid {field} field: expected a string", "bad_request")
+    for field in ("address", "selection_id", "balance_round", "vote_round")
+}
 
 
 class WeightDaemon:
     """Mock weight oracle daemon for testing."""
 
+    # Fixed attribute layout: every request reads several of these, and slot
+    # access skips the per-instance __dict__ lookup.
+    __slots__ = (
+        "port",
+        "genesis_hash",
+        "protocol_version",
+        "algorithm_version",
+        "latency",
+        "weight_table",
+        "_weight_table",
+        "total_weight",
+        "default_weight",
+        "address_weights",
+        "_address_weights",
+        "reuse_port",
+        "max_connections",
+        "_genesis_hash_b64",
+        "_ping_payload",
+        "_identity_payload",
+        "_address_weight_payloads",
+        "_lock",
+        "_loop",
+        "_stopping",
+        "_stop_requested",
+        "_connections",
+    )
+
     def __init__(
         self,
         port: int,
@@ -132,10 +161,12 @@ class WeightDaemon:
         protocol_version: str = "1.0",
         algorithm_version: str = "1.0",
         latency: float = 0.0,
-        weight_table: dict[str, int] | None = None,
+        weight_table: dict[tuple[str, str, str], int] | dict[str, int] | None = None,
         total_weight: int = 1000000,
         default_weight: int | None = None,
         address_weights: dict[str, int] | None = None,
+        reuse_port: bool = False,
+        max_connections: int | None = None,
     ):
         """
         Initialize the mock daemon.
@@ -146,48 +177,133 @@ class WeightDaemon:
             protocol_version: Weight protocol version string
             algorithm_version: Weight algorithm version string
             latency: Artificial latency to add to each response (seconds)
-            weight_table: Dict mapping "address:selection_id:balance_round" to weight
+            weight_table: Dict mapping (address, selection_id, balance_round) tuples to weight
+                (legacy "address:selection_id:balance_round" string keys are split on load).
+                It is copied; change it afterwards with set_weight().
             total_weight: Default total weight to return
             default_weight: If set, return this weight for all queries (bypasses table lookup)
-            address_weights: Dict mapping just address to weight (simpler lookup, ignores selection_id/round)
+            address_weights: Dict mapping just address to weight (simpler lookup, ignores selection_id/round).
+                It is copied; change it afterwards with set_address_weight().
+            reuse_port: Bind with SO_REUSEPORT so several worker processes can share the port
+            max_connections: If set, refuse connections beyond this many open ones (500 "internal")
         """
         self.port = port
         self.genesis_hash = genesis_hash
         self.protocol_version = protocol_version
         self.algorithm_version = algorithm_version
         self.latency = latency
-        self.weight_table = weight_table or {}
+        # Both tables are private copies behind read-only views, so every change
+        # goes through set_weight()/set_address_weight() and the lock. For
+        # address_weights this also keeps the serialized payload cache in sync.
+        self._weight_table = normalize_weight_table(weight_table or {})
+        self.weight_table = types.MappingProxyType(self._weight_table)
         self.total_weight = total_weight
         self.default_weight = default_weight
-        self.address_weights = address_weights or {}
+        self._address_weights = normalize_address_weights(address_weights or {})
+        self.address_weights = types.MappingProxyType(self._address_weights)
+        self.reuse_port = reuse_port
+        self.max_connections = max_connections
+        # Ping and identity responses never change, so they are serialized once.
+        self._genesis_hash_b64 = base64.b64encode(genesis_hash).decode("ascii")
+        self._ping_payload = _json_dumps({"pong": True})
+        self._identity_payload = _json_dumps(
+            {
+                "genesis_hash": self._genesis_hash_b64,
+                "protocol_version": protocol_version,
+                "algorithm_version": algorithm_version,
+            }
+        )
+        # address_weights responses are serialized once, up front or in set_address_weight().
+        self._address_weight_payloads = {
+            address: weight_payload(weight) for address, weight in self._address_weights.items()
+        }
+        # weight_table and address_weights are read-mostly: the event loop reads
+        # them without locking (single dict lookups are atomic, including on
+        # free-threaded builds), and the lock only serializes the set_*()
+        # calls from test threads.
         self._lock = threading.Lock()
-        self.server: HTTPServer | None = None
+        self._loop: asyncio.AbstractEventLoop | None = None
+        self._stopping: asyncio.Event | None = None
+        # Records stop() calls made before the loop is up, so they are not lost.
+        self._stop_requested = threading.Event()
+        self._connections: set[asyncio.BaseTransport] = set()
 
     def start(self) -> None:
-        """Start the daemon server."""
-        self.server = HTTPServer(("127.0.0.1", self.port), WeightDaemonHandler)
-        self.server.daemon = self  # type: ignore[attr-defined]
-        print(f"Weight daemon listening on http://127.0.0.1:{self.port}", file=sys.stderr)
-        self.server.serve_forever()
+        """Start the daemon server (blocks until stop() is called)."""
+        if uvloop is not None:
+            uvloop.run(self._serve())
+        else:
+            asyncio.run(self._serve())
 
     def stop(self) -> None:
-        """Stop the daemon server gracefully."""
-        if self.server:
-            self.server.shutdown()
+        """Stop the daemon server gracefully (safe to call from any thread, even before start())."""
+        self._stop_requested.set()
+        loop, stopping = self._loop, self._stopping
+        if loop is not None and stopping is not None and not loop.is_closed():
+            loop.call_soon_threadsafe(stopping.set)
+
+    async def _serve(self) -> None:
+        """Accept connections on the event loop until stop() is called."""
+        loop = asyncio.get_running_loop()
+        self._loop = loop
+        self._stopping = asyncio.Event()
+        # Set after _loop/_stopping, so a concurrent stop() either sees them or
+        # has already set _stop_requested.
+        if self._stop_requested.is_set():
+            self._stopping.set()
+        server = await loop.create_server(
+            lambda: _Connection(self), "127.0.0.1", self.port, backlog=1024, reuse_port=self.reuse_port or None
+        )
+        print(
+            f"Weight daemon listening on http://127.0.0.1:{self.port} (genesis hash {self._genesis_hash_b64})",
+            file=sys.stderr,
+        )
+        try:
+            await self._stopping.wait()
+        finally:
+            server.close()
+            # Close idle keep-alive connections too; wait_closed() waits for them.
+            for transport in list(self._connections):
+                transport.close()
+            await server.wait_closed()
+            await asyncio.sleep(0)  # let connection_lost() callbacks run
+            self._loop = None
+            self._stop_requested.clear()
+
+    def _respond(self, method: str, path: str, body: bytes | memoryview) -> tuple[int, bytes]:
+        """Handle one parsed HTTP request and return (status, JSON payload)."""
+        if method != "POST":
+            return _error_response(f"Unsupported method: {method}", "bad_request")
+        try:
+            return self._dispatch(path, body)
+        except Exception as e:
+            return _error_response(f"Internal error: {e}", "internal")
 
-    def _handle_ping(self) -> dict[str, Any]:
+    def _dispatch(self, path: str, body: bytes | memoryview) -> tuple[int, bytes]:
+        """Route a request body to its endpoint and return (status, JSON payload)."""
+        try:
+            request = _json_loads(body) if body else {}
+        except ValueError:  # JSONDecodeError (json and orjson) and UnicodeDecodeError
+            return _INVALID_JSON_RESPONSE
+        # Valid JSON that is not an object ([1,2], null, 1) is still a bad request,
+        # not an internal error in a handler.
+        if not isinstance(request, dict):
+            return _NOT_AN_OBJECT_RESPONSE
+
+        handler = self._ROUTES.get(path)
+        if handler is None:
+            return _error_response(f"Unknown endpoint: {path}", "not_found")
+        return handler(self, request)
+
+    def _handle_ping(self, request: dict[str, Any]) -> tuple[int, bytes]:
         """Handle a ping request."""
-        return {"pong": True}
+        return 200, self._ping_payload
 
-    def _handle_identity(self) -> dict[str, Any]:
+    def _handle_identity(self, request: dict[str, Any]) -> tuple[int, bytes]:
         """Handle an identity request."""
-        return {
-            "genesis_hash": base64.b64encode(self.genesis_hash).decode("ascii"),
-            "protocol_version": self.protocol_version,
-            "algorithm_version": self.algorithm_version,
-        }
+        return 200, self._identity_payload
 
-    def _handle_weight(self, request: dict[str, Any]) -> dict[str, Any]:
+    def _handle_weight(self, request: dict[str, Any]) -> tuple[int, bytes]:
         """Handle a weight request."""
         # Validate required fields
         address = request.get("address")
@@ -195,50 +311,70 @@ class WeightDaemon:
         balance_round = request.get("balance_round")
 
         if not address:
-            return {"error": "Missing address field", "code": "bad_request"}
+            return _MISSING_FIELD_RESPONSES["address"]
         if not selection_id:
-            return {"error": "Missing selection_id field", "code": "bad_request"}
+            return _MISSING_FIELD_RESPONSES["selection_id"]
         if not balance_round:
-            return {"error": "Missing balance_round field", "code": "bad_request"}
+            return _MISSING_FIELD_RESPONSES["balance_round"]
+        if not isinstance(address, str):
+            return _NON_STRING_FIELD_RESPONSES["address"]
+        if not isinstance(selection_id, str):
+            return _NON_STRING_FIELD_RESPONSES["selection_id"]
+        if not isinstance(balance_round, str):
+            return _NON_STRING_FIELD_RESPONSES["balance_round"]
 
         # If default_weight is set, return it for all queries (bypasses table lookup)
         if self.default_weight is not None:
-            return {"weight": str(self.default_weight)}
+            return 200, weight_payload(self.default_weight)
 
-        with self._lock:
-            # First check address_weights (simple address-only lookup)
-            # This is the preferred method for testing weighted consensus
-            if address in self.address_weights:
-                return {"weight": str(self.address_weights[address])}
-
-            # Fall back to full key lookup in weight_table
-            key = f"{address}:{selection_id}:{balance_round}"
-            if key in self.weight_table:
-                weight = self.weight_table[key]
-            else:
-                # Default behavior: return a weight based on address hash for consistency
-                # This allows testing without a full weight table
-                weight = sum(ord(c) for c in address) % 1000000
-
-        return {"weight": str(weight)}
-
-    def _handle_total_weight(self, request: dict[str, Any]) -> dict[str, Any]:
+        payload = self._address_weight_payloads.get(address)
+        if payload is not None:
+            return 200, payload
+
+        # address_weights is fully mirrored by the payload cache above, so a miss
+        # only needs the full weight table and the fallback.
+        weight = lookup_weight(self._weight_table, address, selection_id, balance_round)
+        return 200, weight_payload(weight)
+
+    def _handle_total_weight(self, request: dict[str, Any]) -> tuple[int, bytes]:
         """Handle a total_weight request."""
         balance_round = request.get("balance_round")
         vote_round = request.get("vote_round")
 
         if not balance_round:
-            return {"error": "Missing balance_round field", "code": "bad_request"}
+            return _MISSING_FIELD_RESPONSES["balance_round"]
         if not vote_round:
-            return {"error": "Missing vote_round field", "code": "bad_request"}
-
-        return {"total_weight": str(self.total_weight)}
+            return _MISSING_FIELD_RESPONSES["vote_round"]
+        if not isinstance(balance_round, str):
+            return _NON_STRING_FIELD_RESPONSES["balance_round"]
+        if not isinstance(vote_round, str):
+            return _NON_STRING_FIELD_RESPONSES["vote_round"]
+
+        return 200, total_weight_payload(self.total_weight)
+
+    # Endpoint path -> handler. Every handler takes the parsed request body and
+    # returns (status, JSON payload).
+    _ROUTES: dict[str, Callable[["WeightDaemon", dict[str, Any]], tuple[int, bytes]]] = {
+        "/ping": _handle_ping,
+        "/identity": _handle_identity,
+        "/weight": _handle_weight,
+        "/total_weight": _handle_total_weight,
+    }
 
     def set_weight(self, address: str, selection_id: str, balance_round: str, weight: int) -> None:
         """Set a specific weight in the weight table (thread-safe)."""
-        key = f"{address}:{selection_id}:{balance_round}"
+        key = (address, selection_id, balance_round)
+        weight = parse_weight(weight, key)
+        with self._lock:
+            self._weight_table[key] = weight
+
+    def set_address_weight(self, address: str, weight: int) -> None:
+        """Set the weight returned for an address regardless of selection_id/round (thread-safe)."""
+        weight = parse_weight(weight, address)
+        payload = weight_payload(weight)
         with self._lock:
-            self.weight_table[key] = weight
+            self._address_weights[address] = weight
+            self._address_weight_payloads[address] = payload
 
     def set_total_weight(self, total_weight: int) -> None:
         """Set the total weight returned by total_weight queries (thread-safe)."""
@@ -246,10 +382,13 @@ class WeightDaemon:
             self.total_weight = total_weight
 
 
-def load_weight_table(filename: str) -> dict[str, int]:
+def load_weight_table(filename: str) -> dict[tuple[str, str, str], int]:
     """
     Load a weight table from a JSON file.
 
+    Keys are split into (address, selection_id, balance_round) tuples once here,
+    so lookups never have to build the joined string per request.
+
     Expected format:
     {
         "weights": {
@@ -260,7 +399,42 @@ def load_weight_table(filename: str) -> dict[str, int]:
     """
     with open(filename, "r") as f:
         data = json.load(f)
-    return data.get("weights", {})
+    return normalize_weight_table(data.get("weights", {}))
+
+
+def normalize_weight_table(table: dict[Any, Any]) -> dict[tuple[str, str, str], int]:
+    """
+    Return a weight table keyed by (address, selection_id, balance_round) tuples.
+
+    "address:selection_id:balance_round" string keys are split into tuples and
+    tuple keys are kept. Weights are checked with parse_weight. The result is
+    always a new dict. Raises ValueError for any other key.
+    """
+    normalized = {}
+    for key, weight in table.items():
+        if isinstance(key, tuple) and len(key) == 3:
+            normalized[key] = parse_weight(weight, key)
+            continue
+        parts = key.split(":", 2) if isinstance(key, str) else []
+        if len(parts) != 3:
+            raise ValueError(f"Invalid weight table key {key!r}: expected address:selection_id:balance_round")
+        normalized[(parts[0], parts[1], parts[2])] = parse_weight(weight, key)
+    return normalized
+
+
+def parse_weight(weight: Any, key: object) -> int:
+    """
+    Return a weight table value as an int.
+
+    Decimal strings such as "123" are converted. Anything else that is not an
+    int (floats, booleans, null) raises ValueError naming the key, so a bad
+    weight file fails at startup instead of on every query.
+    """
+    if isinstance(weight, str) and weight.isascii() and weight.isdigit():
+        return int(weight)
+    if not isinstance(weight, int) or isinstance(weight, bool):
+        raise ValueError(f"Invalid weight {weight!r} for {key!r}: expected an integer")
+    return weight
 
 
 def load_address_weights(filename: str) -> dict[str, int]:
@@ -277,7 +451,12 @@ def load_address_weights(filename: str) -> dict[str, int]:
     Used for testing weighted consensus where all nodes need the same view of weights.
     """
     with open(filename, "r") as f:
-        return json.load(f)
+        return normalize_address_weights(json.load(f))
+
+
+def normalize_address_weights(weights: dict[str, Any]) -> dict[str, int]:
+    """Return a new address -> weight dict, with every weight checked by parse_weight."""
+    return {address: parse_weight(weight, address) for address, weight in weights.items()}
 
 
 def parse_genesis_hash(genesis_hash_str: str) -> bytes:
@@ -302,6 +481,206 @@ def parse_genesis_hash(genesis_hash_str: str) -> bytes:
     )
 
 
+# How long a connection that was sent an error may keep sending before it is
+# closed. Closing while request bytes are still unread makes the kernel send a
+# reset, which can discard the error response before the client reads it.
+_LINGER_TIMEOUT = 2.0
+
+
+class _Connection(asyncio.BufferedProtocol):
+    """
+    One client connection, serving HTTP/1.1 requests in order.
+
+    The event loop reads straight into a per-connection buffer that is reused
+    for every request on the connection (it is compacted, not reallocated), and
+    request bodies are parsed from a memoryview of it without copying.
+    """
+
+    __slots__ = ("_daemon", "_transport", "_buf", "_used", "_need", "_delayed", "_lingering")
+
+    def __init__(self, daemon: WeightDaemon):
+        self._daemon = daemon
+        self._transport: asyncio.Transport | None = None
+        self._buf = bytearray()
+        self._used = 0
+        # Buffer size needed to hold the request currently being received.
+        self._need = 0
+        # True while a response is delayed by the configured latency.
+        self._delayed = False
+        # True once an error response has been sent; further input is discarded.
+        self._lingering = False
+
+    def connection_made(self, transport: asyncio.BaseTransport) -> None:
+        # A cast rather than an isinstance() check: uvloop's TCP transports
+        # implement the Transport interface without subclassing it.
+        stream = cast(asyncio.Transport, transport)
+        self._transport = stream
+        limit = self._daemon.max_connections
+        if limit is not None and len(self._daemon._connections) >= limit:
+            # Shed the connection before allocating anything for it.
+            stream.write(http_response(*_error_response("Too many connections", "internal"), False))
+            stream.close()
+            return
+        self._daemon._connections.add(transport)
+        self._buf = bytearray(MAX_HEAD_SIZE)
+
+    def connection_lost(self, exc: Exception | None) -> None:
+        if self._transport is not None:
+            self._daemon._connections.discard(self._transport)
+
+    def get_buffer(self, sizehint: int) -> memoryview:
+        # Grow here rather than in buffer_updated(): the loop still holds the
+        # previous view during that callback, and a bytearray with live views
+        # cannot be resized.
+        need = max(self._need, self._used + 1)
+        if len(self._buf) < need:
+            self._buf.extend(bytes(need - len(self._buf)))
+        return memoryview(self._buf)[self._used :]
+
+    def buffer_updated(self, nbytes: int) -> None:
+        if self._lingering:
+            return
+        self._used += nbytes
+        self._process()
+
+    def pause_writing(self) -> None:
+        # The client is not reading its responses; stop reading its requests.
+        if self._transport is not None:
+            self._transport.pause_reading()
+
+    def resume_writing(self) -> None:
+        if self._transport is not None and not self._delayed:
+            self._transport.resume_reading()
+
+    def _process(self) -> None:
+        """Serve every complete request in the buffer."""
+        transport = self._transport
+        while transport is not None and not self._delayed and not transport.is_closing():
+            buf = self._buf
+            head_end = buf.find(b"\r\n\r\n", 0, self._used)
+            if head_end < 0:
+                if self._used >= MAX_HEAD_SIZE:
+                    self._reject(transport, _HEAD_TOO_LARGE_RESPONSE)
+                return
+
+            parsed = parse_request_head(bytes(buf[:head_end]))
+            if parsed is None:
+                self._reject(transport, _MALFORMED_REQUEST_LINE_RESPONSE)
+                return
+            method, path, keep_alive, headers = parsed
+
+            try:
+                length = content_length(headers)
+            except ValueError as e:
+                self._reject(transport, _error_response(str(e), "bad_request"))
+                return
+
+            body_start = head_end + 4
+            request_end = body_start + length
+            if request_end > self._used:
+                self._need = request_end
+                return
+            self._need = 0
+
+            with memoryview(buf) as view:
+                status, payload = self._daemon._respond(method, path, view[body_start:request_end])
+            response = http_response(status, payload, keep_alive)
+
+            # Shift any pipelined bytes to the front of the buffer.
+            remaining = self._used - request_end
+            buf[:remaining] = buf[request_end : self._used]
+            self._used = remaining
+
+            # Apply latency if configured
+            latency = self._daemon.latency
+            if latency > 0:
+                self._delayed = True
+                transport.pause_reading()
+                asyncio.get_running_loop().call_later(latency, self._send_delayed, response, keep_alive)
+                return
+            transport.write(response)
+            if not keep_alive:
+                transport.close()
+
+    def _reject(self, transport: asyncio.Transport, response: tuple[int, bytes]) -> None:
+        """Answer a request that cannot be framed with a JSON error and stop serving the connection."""
+        transport.write(http_response(*response, False))
+        # Half-close and drain instead of closing outright, so unread request
+        # bytes do not turn the close into a reset. The connection closes when
+        # the client closes its side (eof_received) or after _LINGER_TIMEOUT.
+        self._lingering = True
+        self._used = 0
+        self._need = 0
+        if transport.can_write_eof():
+            transport.write_eof()
+            asyncio.get_running_loop().call_later(_LINGER_TIMEOUT, transport.close)
+        else:
+            transport.close()
+
+    def _send_delayed(self, response: bytes, keep_alive: bool) -> None:
+        """Send a response held back by the configured latency, then resume serving."""
+        self._delayed = False
+        transport = self._transport
+        if transport is None or transport.is_closing():
+            return
+        transport.write(response)
+        if not keep_alive:
+            transport.close()
+            return
+        transport.resume_reading()
+        self._process()
+
+
+def _stop_on_parent_exit(daemon: WeightDaemon, liveness_fd: int) -> None:
+    """Block until the parent closes its end of the liveness pipe, then stop the daemon."""
+    os.read(liveness_fd, 1)
+    daemon.stop()
+
+
+def run_workers(daemon: WeightDaemon, workers: int) -> int:
+    """
+    Serve the daemon from several forked worker processes sharing its port.
+
+    Each worker binds the port with SO_REUSEPORT and the kernel spreads incoming
+    connections across them, so JSON work is no longer serialized by one GIL.
+    Workers stop when the parent exits for any reason (including SIGKILL),
+    because the write end of the liveness pipe closes with it.
+
+    Returns the process exit status: 0, or 1 if any worker failed.
+    """
+    daemon.reuse_port = True
+    liveness_r, liveness_w = os.pipe()
+    pids = []
+    for _ in range(workers):
+        pid = os.fork()
+        if pid == 0:
+            os.close(liveness_w)
+            threading.Thread(target=_stop_on_parent_exit, args=(daemon, liveness_r), daemon=True).start()
+            status = 0
+            try:
+                daemon.start()
+            except KeyboardInterrupt:
+                pass
+            except OSError as e:
+                print(f"Worker {os.getpid()} failed: {e}", file=sys.stderr)
+                status = 1
+            os._exit(status)
+        pids.append(pid)
+    os.close(liveness_r)
+
+    failed = False
+    try:
+        for pid in pids:
+            _, wait_status = os.waitpid(pid, 0)
+            failed = failed or os.waitstatus_to_exitcode(wait_status) != 0
+    except KeyboardInterrupt:
+        print("\nShutting down...", file=sys.stderr)
+        os.close(liveness_w)
+        for pid in pids:
+            os.waitpid(pid, 0)
+    return 1 if failed else 0
+
+
 def main() -> None:
     parser = argparse.ArgumentParser(
         description="Mock Weight Oracle Daemon for Testing (HTTP REST)",
@@ -384,8 +763,24 @@ Examples:
         default=None,
         help="JSON file mapping addresses to weights (simpler than --weight-file)",
     )
+    parser.add_argument(
+        "--workers",
+        type=int,
+        default=1,
+        help="Number of worker processes sharing the port via SO_REUSEPORT (default: 1, POSIX only)",
+    )
+    parser.add_argument(
+        "--max-connections",
+        type=int,
+        default=None,
+        help="Refuse connections beyond this many open ones, per worker (default: unlimited)",
+    )
 
     args = parser.parse_args()
+    if args.workers < 1:
+        parser.error("--workers must be at least 1")
+    if args.max_connections is not None and args.max_connections < 1:
+        parser.error("--max-connections must be at least 1")
 
     # Parse or generate genesis hash
     if args.genesis_hash:
@@ -425,8 +820,12 @@ Examples:
         total_weight=args.total_weight,
         default_weight=args.default_weight,
         address_weights=address_weights,
+        max_connections=args.max_connections,
     )
 
+    if args.workers > 1:
+        sys.exit(run_workers(daemon, args.workers))
+
     try:
         daemon.start()
     except KeyboardInterrupt: